@@ -18,13 +18,18 @@ import traceback
 from main import (
     BOOK_ALIASES,
     SPORT_KEYS,
+    DEFAULT_CACHE_TTL,
+    configure_session,
     parse_books,
+    parse_sports,
     get_regions_needed,
     collect_all_odds,
     find_all_opportunities,
     select_best_opportunity,
+    hedge_rank,
     find_qualifying_opportunities,
     select_best_qualifying_opportunity,
+    qualifying_hedge_rank,
     calculate_hedge,
     calculate_qualifying_hedge,
     Logger,
@@ -40,6 +45,9 @@ class HedgeFinderGUI:
         # Setup logger for GUI
         self.logger = Logger("debug.log")
 
+        # Reuse recent API responses across searches
+        configure_session(DEFAULT_CACHE_TTL, memoize=True)
+
         # Mode: "bonus" or "qualifying"
         self.mode_var = tk.StringVar(value="bonus")
 
@@ -592,6 +600,9 @@ class HedgeFinderGUI:
             hedge_books = parse_books(','.join(selected_books))
             self.logger.debug(f"[GUI] hedge_books = {hedge_books}")
             
+            sport_keys = parse_sports(','.join(selected_sports))
+            self.logger.debug(f"[GUI] sport_keys = {sport_keys}")
+            
             # All books (bonus + hedge)
             all_books = hedge_books | {bonus_book}
             regions = get_regions_needed(all_books)
@@ -600,11 +611,11 @@ class HedgeFinderGUI:
             self.logger.debug(f"[GUI] regions = {regions}")
             
             # Calculate total API calls for better progress
-            total_calls = len(selected_sports) * len(regions)
+            total_calls = len(sport_keys) * len(regions)
             
             # Update status with initial info
             self.root.after(0, lambda: self.status_var.set(
-                f"Fetching odds for {len(selected_sports)} sports ({total_calls} API calls)..."
+                f"Fetching odds for {len(sport_keys)} sports ({total_calls} API calls)..."
             ))
             
             self.logger.debug("[GUI] About to call collect_all_odds")
@@ -620,7 +631,7 @@ class HedgeFinderGUI:
             try:
                 odds_rows = collect_all_odds(
                     api_key, 
-                    selected_sports, 
+                    sport_keys, 
                     regions, 
                     all_books,
                     progress_callback=update_progress
@@ -640,7 +651,7 @@ class HedgeFinderGUI:
             
             # Update status
             self.root.after(0, lambda: self.status_var.set(
-                f"Analyzing {len(odds_rows)} odds entries..."
+                f"Analyzing {len(odds_rows)} odds markets..."
             ))
             
             if len(odds_rows) == 0:
@@ -696,7 +707,7 @@ class HedgeFinderGUI:
         # Header
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.results_text.insert(tk.END, f"Search completed at {timestamp}\n", "header")
-        self.results_text.insert(tk.END, f"Analyzed {odds_count} odds entries\n\n", "header")
+        self.results_text.insert(tk.END, f"Analyzed {odds_count} odds markets\n\n", "header")
         
         if not opportunities:
             self.results_text.insert(
@@ -764,7 +775,7 @@ class HedgeFinderGUI:
             self.results_text.insert(tk.END, "-" * 80 + "\n")
             
             # Sort by efficiency
-            sorted_opps = sorted(opportunities, key=lambda x: x.efficiency, reverse=True)
+            sorted_opps = sorted(opportunities, key=hedge_rank)
             
             for i, opp in enumerate(sorted_opps[:20], 1):  # Show top 20
                 self.results_text.insert(tk.END, f"\n#{i}. {opp.event}\n")
@@ -799,7 +810,7 @@ class HedgeFinderGUI:
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.results_text.insert(tk.END, f"Search completed at {timestamp}\n", "header")
-        self.results_text.insert(tk.END, f"Analyzed {odds_count} odds entries\n\n", "header")
+        self.results_text.insert(tk.END, f"Analyzed {odds_count} odds markets\n\n", "header")
 
         if not opportunities:
             self.results_text.insert(tk.END, "No qualifying hedge opportunities found.\n", "error")
@@ -842,7 +853,7 @@ class HedgeFinderGUI:
             )
             self.results_text.insert(tk.END, "-" * 80 + "\n")
 
-            sorted_opps = sorted(opportunities, key=lambda x: x.loss_pct)
+            sorted_opps = sorted(opportunities, key=qualifying_hedge_rank)
 
             for i, opp in enumerate(sorted_opps[:20], 1):
                 label = "Profit" if opp.loss < 0 else "Loss"
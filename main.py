@@ -1,32 +1,74 @@
 from __future__ import annotations
 import argparse
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 from datetime import datetime
 
+try:
+    import requests_cache
+except ImportError:  # optional: responses are simply not cached
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # optional: responses are parsed with Response.json()
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: the hedge search falls back to pure Python
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: the NumPy search reduces with argmax instead
+    njit = None
+
 
 # -----------------------
 # LOGGING SETUP
 # -----------------------
 
 class Logger:
-    def __init__(self, debug_file="debug.log"):
+    def __init__(self, debug_file="debug.log", enabled_debug=True):
         self.debug_file = debug_file
+        # Check before building expensive debug messages, like logging.Logger.isEnabledFor
+        self.enabled_debug = enabled_debug
+        # Keep one line-buffered handle open instead of reopening per message.
+        # Append mode keeps writes at the end if another Logger shares the file.
+        self._fh = open(self.debug_file, 'a', buffering=1)
+        self._lock = threading.Lock()
+        atexit.register(self._fh.close)
         # Clear the debug file at start
-        with open(self.debug_file, 'w') as f:
-            f.write(f"=== Debug Log Started: {datetime.now()} ===\n\n")
+        self._fh.truncate(0)
+        self._write(f"=== Debug Log Started: {datetime.now()} ===\n\n")
+    
+    def _write(self, text):
+        # Fetch threads log concurrently
+        with self._lock:
+            self._fh.write(text)
     
     def debug(self, msg):
         """Write to debug file only"""
-        with open(self.debug_file, 'a') as f:
-            f.write(f"[DEBUG] {msg}\n")
+        if not self.enabled_debug:
+            return
+        self._write(f"[DEBUG] {msg}\n")
     
     def info(self, msg):
         """Write to log file only"""
-        with open(self.debug_file, 'a') as f:
-            f.write(f"[INFO] {msg}\n")
+        self._write(f"[INFO] {msg}\n")
+    
+    def info_lines(self, msgs):
+        """Write several messages to log file in a single write"""
+        self._write("".join([f"[INFO] {msg}\n" for msg in msgs]))
     
     def console(self, msg):
         """Write to console only"""
@@ -35,8 +77,7 @@ class Logger:
     def both(self, msg):
         """Write to both console and debug file"""
         print(msg)
-        with open(self.debug_file, 'a') as f:
-            f.write(f"{msg}\n")
+        self._write(f"{msg}\n")
 
 logger = Logger()
 
@@ -62,22 +103,28 @@ BOOK_ALIASES = {
     "hardrockbet": "hardrockbet",
 }
 
-US_BOOKS = {
+US_BOOKS = frozenset({
     "fanduel",
     "draftkings",
     "williamhill_us",
     "betrivers",
     "fanatics",
     "betmgm",
-}
+})
 
-US2_BOOKS = {
+US2_BOOKS = frozenset({
     "ballybet",
     "espnbet",
     "betparx",
     "fliff",
     "hardrockbet",
-}
+})
+
+# Region to query for each group of books
+REGION_BOOKS = (
+    ("us", US_BOOKS),
+    ("us2", US2_BOOKS),
+)
 
 SPORT_KEYS = {
     "nba": "basketball_nba",
@@ -89,22 +136,42 @@ SPORT_KEYS = {
     "nhl": "icehockey_nhl"
 }
 
+# Short sport name for each API sport key, for progress messages
+SPORT_NAMES = {key: name for name, key in SPORT_KEYS.items()}
+
 
 # -----------------------
 # DATA STRUCTURES
 # -----------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OddsRow:
-    """Single odds entry from a bookmaker"""
+    """Two-way h2h market from a bookmaker, priced on both outcomes"""
     event: str
     selection: str
     opposite: str
     book: str
-    odds: float
-
-
-@dataclass
+    odds: float           # price on selection
+    opposite_odds: float  # price on opposite
+    # Decimal forms of the prices, converted once when parsed
+    decimal_odds: float
+    opposite_decimal_odds: float
+
+    def flipped(self) -> OddsRow:
+        """The same market with selection and opposite swapped"""
+        return OddsRow(
+            event=self.event,
+            selection=self.opposite,
+            opposite=self.selection,
+            book=self.book,
+            odds=self.opposite_odds,
+            opposite_odds=self.odds,
+            decimal_odds=self.opposite_decimal_odds,
+            opposite_decimal_odds=self.decimal_odds
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class HedgeOpportunity:
     """Calculated hedge opportunity"""
     event: str
@@ -119,7 +186,7 @@ class HedgeOpportunity:
     efficiency: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualifyingHedgeOpportunity:
     """Calculated hedge opportunity for a qualifying (cash) bet"""
     event: str
@@ -138,21 +205,26 @@ class QualifyingHedgeOpportunity:
 # CONFIGURATION
 # -----------------------
 
-def parse_books(book_string: str) -> set[str]:
+def parse_books(book_string: str) -> frozenset[str]:
     """Parse comma-separated book names into API book keys"""
-    return {
+    return frozenset(
         BOOK_ALIASES[b.strip().lower()]
         for b in book_string.split(",")
-    }
+    )
 
 
-def get_regions_needed(all_books: set[str]) -> list[str]:
+def parse_sports(sport_string: str) -> Tuple[str, ...]:
+    """Parse comma-separated sport names into API sport keys, dropping repeats"""
+    return tuple(dict.fromkeys(
+        SPORT_KEYS[s.strip().lower()]
+        for s in sport_string.split(",")
+    ))
+
+
+def get_regions_needed(all_books: frozenset[str]) -> list[str]:
     """Determine which region(s) to query based on books needed."""
-    regions = []
-    if all_books & US_BOOKS:
-        regions.append("us")
-    if all_books & US2_BOOKS:
-        regions.append("us2")
+    # isdisjoint stops at the first shared book without building an intersection
+    regions = [region for region, books in REGION_BOOKS if not books.isdisjoint(all_books)]
     return regions if regions else ["us"]
 
 
@@ -165,20 +237,36 @@ def american_to_decimal(o: float) -> float:
     return 1 + (o / 100 if o > 0 else 100 / abs(o))
 
 
-def calculate_hedge(stake: float, bonus_odds: float, hedge_odds: float) -> Tuple[float, float, float]:
+def bonus_winnings(stake: float, dA: float) -> float:
+    """Net payout of a winning bonus bet at decimal odds dA (the stake itself is not returned)"""
+    return stake * (dA - 1)
+
+
+def hedge_bonus_winnings(winnings: float, dB: float) -> Tuple[float, float]:
     """
-    Calculate hedge stake, profit, and efficiency
+    Calculate hedge stake and locked profit for a bonus bet's winnings
+    at decimal hedge odds dB
 
     Returns:
-        (hedge_stake, profit, efficiency)
+        (hedge_stake, profit)
     """
-    dA = american_to_decimal(bonus_odds)
-    dB = american_to_decimal(hedge_odds)
-    hedge = stake * (dA - 1) / dB
+    hedge = winnings / dB
     profit = min(
-        stake * (dA - 1) - hedge,
+        winnings - hedge,
         hedge * (dB - 1),
     )
+    return hedge, profit
+
+
+def calculate_hedge(stake: float, bonus_odds: float, hedge_odds: float) -> Tuple[float, float, float]:
+    """
+    Calculate hedge stake, profit, and efficiency
+
+    Returns:
+        (hedge_stake, profit, efficiency)
+    """
+    winnings = bonus_winnings(stake, american_to_decimal(bonus_odds))
+    hedge, profit = hedge_bonus_winnings(winnings, american_to_decimal(hedge_odds))
     efficiency = profit / stake
     return hedge, profit, efficiency
 
@@ -204,6 +292,78 @@ def calculate_qualifying_hedge(stake: float, qual_odds: float, hedge_odds: float
 # API
 # -----------------------
 
+# Upper bound on concurrent API requests
+MAX_FETCH_WORKERS = 16
+
+# On-disk response cache (odds_cache.sqlite), used when requests-cache is installed
+CACHE_NAME = "odds_cache"
+DEFAULT_CACHE_TTL = 30
+
+
+def create_session(cache_ttl: Optional[float] = DEFAULT_CACHE_TTL) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections and retries
+
+    Args:
+        cache_ttl: Seconds to reuse a cached response, or None to disable caching
+    """
+    if cache_ttl and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            CACHE_NAME,
+            expire_after=cache_ttl,
+            allowable_methods=["GET"],
+            # Keep the API key out of cache keys and stored requests
+            ignored_parameters=["apiKey"],
+        )
+    else:
+        session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the last response back so raise_for_status() reports it
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_FETCH_WORKERS,
+        max_retries=retries,
+    ))
+    return session
+
+
+# Shared across fetch threads so connections to the API are reused.
+# Starts uncached so importing this module never opens the disk cache;
+# callers opt in through configure_session().
+_SESSION = create_session(cache_ttl=None)
+
+# Recently fetched events by (sport_key, region), kept for _memo_ttl seconds.
+# Off unless a long-lived caller (the GUI) asks for it: it holds every
+# parsed response until it expires.
+_memo_ttl: Optional[float] = None
+_FETCH_MEMO: Dict[Tuple[str, str], Tuple[float, list]] = {}
+_FETCH_MEMO_LOCK = threading.Lock()
+
+
+def configure_session(cache_ttl: Optional[float], memoize: bool = False):
+    """
+    Replace the shared session, e.g. to enable or disable response caching
+
+    Args:
+        cache_ttl: Seconds to reuse a cached response, or None to disable caching
+        memoize: Also keep parsed responses in memory for cache_ttl seconds
+            (see fetch_odds_memoized), for callers that search repeatedly
+    """
+    global _SESSION, _memo_ttl
+    old_session = _SESSION
+    _SESSION = create_session(cache_ttl)
+    # Also closes a CachedSession's SQLite connection
+    old_session.close()
+    _memo_ttl = cache_ttl if memoize else None
+    with _FETCH_MEMO_LOCK:
+        _FETCH_MEMO.clear()
+
+
 def fetch_odds_for_sport(api_key: str, sport_key: str, region: str) -> list:
     """Fetch odds for a single sport from a single region"""
     url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/odds"
@@ -226,9 +386,10 @@ def fetch_odds_for_sport(api_key: str, sport_key: str, region: str) -> list:
     
     try:
         logger.debug(f"[API] Sending GET request...")
-        r = requests.get(url, params=params, timeout=30)
+        r = _SESSION.get(url, params=params, timeout=30)
         
         logger.debug(f"[API] Response received")
+        logger.debug(f"[API] From cache: {getattr(r, 'from_cache', False)}")
         logger.debug(f"[API] Status code: {r.status_code}")
         logger.debug(f"[API] Response headers:")
         for key, value in r.headers.items():
@@ -246,7 +407,8 @@ def fetch_odds_for_sport(api_key: str, sport_key: str, region: str) -> list:
         r.raise_for_status()
         
         logger.debug(f"[API] Attempting to parse JSON...")
-        data = r.json()
+        # orjson.JSONDecodeError subclasses ValueError, like the stdlib error
+        data = orjson.loads(r.content) if orjson is not None else r.json()
         
         logger.debug(f"[API] Successfully parsed JSON")
         logger.debug(f"[API] Response data type: {type(data)}")
@@ -307,6 +469,34 @@ def fetch_odds_for_sport(api_key: str, sport_key: str, region: str) -> list:
         raise
 
 
+def fetch_odds_memoized(api_key: str, sport_key: str, region: str) -> list:
+    """
+    fetch_odds_for_sport() with an in-process memo in front of the HTTP cache
+
+    Keyed on (sport_key, region) only: the API key does not change the odds
+    returned. Only active when configure_session() was called with
+    memoize=True; entries then expire with the response cache TTL, so
+    repeated GUI searches reuse recent events without re-reading or
+    re-parsing them.
+    """
+    key = (sport_key, region)
+    now = time.monotonic()
+    
+    if _memo_ttl:
+        with _FETCH_MEMO_LOCK:
+            cached = _FETCH_MEMO.get(key)
+        if cached is not None and now - cached[0] < _memo_ttl:
+            logger.debug(f"[API] Reusing {sport_key}/{region} fetched {now - cached[0]:.1f}s ago")
+            return cached[1]
+    
+    events = fetch_odds_for_sport(api_key, sport_key, region)
+    
+    if _memo_ttl:
+        with _FETCH_MEMO_LOCK:
+            _FETCH_MEMO[key] = (now, events)
+    return events
+
+
 # -----------------------
 # DATA EXTRACTION
 # -----------------------
@@ -324,127 +514,164 @@ def extract_outcomes(market: dict) -> Tuple[dict, dict]:
     return outcomes[0], outcomes[1]
 
 
-def parse_event_odds(event_data: dict, allowed_books: set[str]) -> List[OddsRow]:
+def parse_event_odds(event_data: dict, allowed_books: frozenset[str]) -> Iterator[OddsRow]:
     """
     Parse all odds from a single event
     
     Args:
         event_data: Raw event data from API
-        allowed_books: Set of book keys to include
+        allowed_books: Frozenset of book keys to include
         
-    Returns:
-        List of OddsRow objects
+    Yields:
+        OddsRow objects, one per bookmaker market
     """
     event_name = extract_event_name(event_data)
-    rows = []
     
-    logger.debug(f"\n[PARSE] Event: {event_name}")
-    logger.debug(f"[PARSE] Available books: {[bm['key'] for bm in event_data['bookmakers']]}")
+    # Runs for every event and bookmaker, so skip formatting when debug is off.
+    # Every bookmaker is logged as skipped or included below.
+    debug = logger.enabled_debug
+    if debug:
+        logger.debug(f"\n[PARSE] Event: {event_name}")
     
     for bookmaker in event_data["bookmakers"]:
         book_key = bookmaker["key"]
         
+        # Most bookmakers in a payload are not ones we asked for, so drop
+        # them before looking at any markets
         if book_key not in allowed_books:
-            logger.debug(f"[PARSE] Skipping {book_key} (not in allowed books)")
+            if debug:
+                logger.debug(f"[PARSE] Skipping {book_key} (not in allowed books)")
             continue
-            
-        logger.debug(f"[PARSE] Including {book_key}")
         
-        for market in bookmaker["markets"]:
-            if market["key"] != "h2h":
-                continue
-                
-            outcome_a, outcome_b = extract_outcomes(market)
-            
-            # Create rows for both sides of the market
-            rows.append(OddsRow(
-                event=event_name,
-                selection=outcome_a["name"],
-                opposite=outcome_b["name"],
-                book=book_key,
-                odds=outcome_a["price"]
-            ))
-            rows.append(OddsRow(
-                event=event_name,
-                selection=outcome_b["name"],
-                opposite=outcome_a["name"],
-                book=book_key,
-                odds=outcome_b["price"]
-            ))
-    
-    return rows
-
-
-def collect_all_odds(
+        if debug:
+            logger.debug(f"[PARSE] Including {book_key}")
+        
+        # Each bookmaker lists at most one h2h market
+        market = next((m for m in bookmaker["markets"] if m["key"] == "h2h"), None)
+        if market is None:
+            continue
+        
+        outcome_a, outcome_b = extract_outcomes(market)
+        
+        # One row covers both sides; OddsIndex looks up either outcome
+        yield OddsRow(
+            event=event_name,
+            selection=outcome_a["name"],
+            opposite=outcome_b["name"],
+            book=book_key,
+            odds=outcome_a["price"],
+            opposite_odds=outcome_b["price"],
+            decimal_odds=american_to_decimal(outcome_a["price"]),
+            opposite_decimal_odds=american_to_decimal(outcome_b["price"])
+        )
+
+
+def iter_all_odds(
     api_key: str, 
-    sports: List[str], 
+    sport_keys: Tuple[str, ...], 
     regions: List[str], 
-    allowed_books: set[str],
+    allowed_books: frozenset[str],
     progress_callback=None
-) -> List[OddsRow]:
+) -> Iterator[OddsRow]:
     """
-    Collect all odds across sports and regions
+    Stream odds across sports and regions as API responses arrive
     
     Args:
         api_key: API key for odds service
-        sports: List of sport keys to fetch
+        sport_keys: API sport keys to fetch (see parse_sports)
         regions: List of regions to query
-        allowed_books: Set of book keys to include
+        allowed_books: Book keys to include (see parse_books)
         progress_callback: Optional function(sport_name, current, total) for progress updates
         
-    Returns:
-        List of all OddsRow objects
+    Yields:
+        OddsRow objects, one per bookmaker market
     """
-    all_rows = []
-    
     logger.debug(f"\n[COLLECT] Starting odds collection")
-    logger.debug(f"[COLLECT] Sports to fetch: {sports}")
+    logger.debug(f"[COLLECT] Sports to fetch: {sport_keys}")
     logger.debug(f"[COLLECT] Regions to query: {regions}")
     logger.debug(f"[COLLECT] Books to include: {allowed_books}")
     
-    total_calls = len(sports) * len(regions)
+    tasks = [(sport_key, region) for sport_key in sport_keys for region in regions]
+    total_calls = len(tasks)
     current_call = 0
     
-    for sport in sports:
-        sport_key = SPORT_KEYS[sport.strip()]
-        logger.debug(f"\n[COLLECT] Processing sport: {sport} -> {sport_key}")
+    # Requests are I/O bound, so fetch every sport/region concurrently
+    # and parse each response as soon as it arrives
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, total_calls))) as executor:
+        futures = {
+            executor.submit(fetch_odds_memoized, api_key, sport_key, region): (sport_key, region)
+            for sport_key, region in tasks
+        }
         
-        for region in regions:
+        for future in as_completed(futures):
+            # Drop our reference so the response can be freed once parsed
+            # (unless the fetch memo is enabled and still holds it)
+            sport_key, region = futures.pop(future)
             current_call += 1
             
             # Call progress callback if provided
             if progress_callback:
-                progress_callback(sport.upper(), current_call, total_calls)
+                progress_callback(SPORT_NAMES[sport_key].upper(), current_call, total_calls)
             
-            logger.debug(f"[COLLECT] Fetching from region: {region} ({current_call}/{total_calls})")
+            logger.debug(f"[COLLECT] Received region: {region} for {sport_key} ({current_call}/{total_calls})")
             
             try:
-                events = fetch_odds_for_sport(api_key, sport_key, region)
+                events = future.result()
                 logger.debug(f"[COLLECT] Got {len(events)} events from API")
                 
-                events_processed = 0
-                for event in events:
-                    rows = parse_event_odds(event, allowed_books)
-                    all_rows.extend(rows)
-                    events_processed += 1
-                    if rows:
-                        logger.debug(f"[COLLECT] Event {events_processed}: extracted {len(rows)} odds rows")
+                for events_processed, event in enumerate(events, 1):
+                    row_count = 0
+                    for row in parse_event_odds(event, allowed_books):
+                        row_count += 1
+                        yield row
+                    if row_count:
+                        logger.debug(f"[COLLECT] Event {events_processed}: extracted {row_count} odds rows")
                     
             except Exception as e:
                 logger.debug(f"[COLLECT] ERROR fetching {sport_key} from {region}: {str(e)}")
                 # Continue with other sports/regions instead of failing completely
                 continue
+
+
+def collect_all_odds(
+    api_key: str, 
+    sport_keys: Tuple[str, ...], 
+    regions: List[str], 
+    allowed_books: frozenset[str],
+    progress_callback=None
+) -> List[OddsRow]:
+    """
+    Collect all odds across sports and regions into a list (see iter_all_odds)
     
+    Args:
+        api_key: API key for odds service
+        sport_keys: API sport keys to fetch (see parse_sports)
+        regions: List of regions to query
+        allowed_books: Book keys to include (see parse_books)
+        progress_callback: Optional function(sport_name, current, total) for progress updates
+        
+    Returns:
+        List of all OddsRow objects
+    """
+    all_rows = list(iter_all_odds(api_key, sport_keys, regions, allowed_books, progress_callback))
     logger.debug(f"\n[COLLECT] Collection complete: {len(all_rows)} total odds rows")
     return all_rows
 
 
-def log_collection_summary(rows: List[OddsRow]):
-    """Log summary of collected odds data"""
+def tally_odds(rows: Iterable[OddsRow], book_counts: Dict[str, int], events: set[str]) -> Iterator[OddsRow]:
+    """Pass rows through unchanged, counting them per book and recording their events"""
+    for row in rows:
+        book_counts[row.book] = book_counts.get(row.book, 0) + 1
+        events.add(row.event)
+        yield row
+
+
+def log_collection_summary(book_counts: Dict[str, int], events: set[str]):
+    """Log summary of collected odds data, as counted by tally_odds()"""
     logger.debug(f"\n[SUMMARY] === Odds Collection Summary ===")
-    logger.debug(f"[SUMMARY] Total odds collected: {len(rows)}")
+    logger.debug(f"[SUMMARY] Total markets collected: {sum(book_counts.values())}")
     
-    if len(rows) == 0:
+    if not book_counts:
         logger.debug(f"[SUMMARY] WARNING - No odds were collected!")
         logger.debug(f"[SUMMARY] Possible reasons:")
         logger.debug(f"[SUMMARY]   - No games available for selected sports")
@@ -454,70 +681,332 @@ def log_collection_summary(rows: List[OddsRow]):
         return
     
     logger.debug(f"[SUMMARY] Books represented:")
-    unique_books = set(r.book for r in rows)
-    for book in unique_books:
-        count = sum(1 for r in rows if r.book == book)
+    for book, count in book_counts.items():
         logger.debug(f"[SUMMARY]   - {book}: {count} entries")
     
     logger.debug(f"[SUMMARY] Events represented:")
-    unique_events = set(r.event for r in rows)
-    logger.debug(f"[SUMMARY]   Total unique events: {len(unique_events)}")
-    for event in sorted(unique_events)[:5]:  # Show first 5
+    logger.debug(f"[SUMMARY]   Total unique events: {len(events)}")
+    for event in sorted(events)[:5]:  # Show first 5
         logger.debug(f"[SUMMARY]   - {event}")
-    if len(unique_events) > 5:
-        logger.debug(f"[SUMMARY]   ... and {len(unique_events) - 5} more")
+    if len(events) > 5:
+        logger.debug(f"[SUMMARY]   ... and {len(events) - 5} more")
 
 
 # -----------------------
 # HEDGE FINDING
 # -----------------------
 
+@dataclass(slots=True)
+class OddsIndex:
+    """
+    Market rows grouped by (event, outcome) so hedge candidates can be
+    looked up directly instead of scanning every row
+    """
+    by_selection: Dict[Tuple[str, str], List[OddsRow]]
+    by_opposite: Dict[Tuple[str, str], List[OddsRow]]
+
+    def add(self, row: OddsRow):
+        """Index a market under both of its outcomes"""
+        self.by_selection.setdefault((row.event, row.selection), []).append(row)
+        self.by_opposite.setdefault((row.event, row.opposite), []).append(row)
+
+    def prices(self, event: str, outcome: str) -> Iterator[Tuple[OddsRow, float, float]]:
+        """
+        Yield every market quoting `outcome` in `event`, with its American
+        and decimal price on that outcome
+        """
+        for row in self.by_selection.get((event, outcome), ()):
+            yield row, row.odds, row.decimal_odds
+        for row in self.by_opposite.get((event, outcome), ()):
+            yield row, row.opposite_odds, row.opposite_decimal_odds
+
+
+HedgeCandidates = List[Tuple[OddsRow, float, float]]
+
+
+def iter_hedge_candidates(
+    rows: Iterable[OddsRow],
+    book: str
+) -> Iterator[Tuple[OddsRow, HedgeCandidates]]:
+    """
+    Match each bet offered by `book` with the prices on its opposite outcome
+    
+    A symmetric hash join over rows as they arrive: each new `book` market is
+    matched against the markets seen so far, and each new market against the
+    `book` bets already seen for its event. Every pair is yielded exactly once,
+    as soon as both halves exist, so the search runs while odds stream in.
+    
+    `book`'s own markets are never indexed as hedges, so candidates need no
+    per-pair book check downstream.
+    
+    Args:
+        rows: Odds rows, in any order
+        book: The book whose bets are being hedged
+        
+    Yields:
+        (side, candidates) where side is one outcome of a `book` market and
+        candidates are (row, American price, decimal price) on side.opposite,
+        from other books
+    """
+    index = OddsIndex(by_selection={}, by_opposite={})
+    sides_by_event: Dict[str, List[OddsRow]] = {}
+    books_seen = set()
+    side_count = 0
+    
+    for row in rows:
+        books_seen.add(row.book)
+        
+        if row.book == book:
+            # Either outcome can be bet, so match both sides of the market
+            for side in (row, row.flipped()):
+                side_count += 1
+                sides_by_event.setdefault(side.event, []).append(side)
+                yield side, list(index.prices(side.event, side.opposite))
+            continue
+        
+        # Offer the new market to the bets already waiting on its event
+        for side in sides_by_event.get(row.event, ()):
+            if row.selection == side.opposite:
+                yield side, [(row, row.odds, row.decimal_odds)]
+            elif row.opposite == side.opposite:
+                yield side, [(row, row.opposite_odds, row.opposite_decimal_odds)]
+        
+        index.add(row)
+    
+    logger.debug(f"[SEARCH] Found {side_count} bets offered by '{book}'")
+    if side_count == 0:
+        logger.debug(f"[SEARCH] WARNING - No odds found for book '{book}'")
+        logger.debug(f"[SEARCH] Available books in data: {books_seen}")
+
+
+def hedge_rank(opp: HedgeOpportunity) -> tuple:
+    """
+    Sort key putting the best hedge first: highest efficiency, then a fixed
+    order on the bet itself so ties don't depend on which API response
+    arrived first
+    """
+    return (-opp.efficiency, opp.event, opp.selection, opp.hedge_book, opp.bonus_odds, opp.hedge_odds)
+
+
+def qualifying_hedge_rank(opp: QualifyingHedgeOpportunity) -> tuple:
+    """Sort key putting the best qualifying hedge first (see hedge_rank)"""
+    return (opp.loss_pct, opp.event, opp.selection, opp.hedge_book, opp.qual_odds, opp.hedge_odds)
+
+
 def find_hedge_for_bonus(
     bonus_row: OddsRow,
-    all_rows: List[OddsRow],
-    stake: float
+    candidates: HedgeCandidates,
+    stake: float,
+    min_efficiency: float
 ) -> List[HedgeOpportunity]:
     """
-    Find all possible hedge opportunities for a given bonus bet
+    Find all hedge opportunities for a given bonus bet that meet minimum efficiency
     
     Args:
         bonus_row: The bonus bet to hedge
-        all_rows: All available odds
+        candidates: Other books' prices on the opposite outcome, from iter_hedge_candidates()
         stake: Bonus bet stake amount
+        min_efficiency: Minimum efficiency threshold (0.0 to 1.0)
         
     Returns:
         List of HedgeOpportunity objects
     """
     opportunities = []
+    # Fixed for every candidate, so work it out once
+    winnings = bonus_winnings(stake, bonus_row.decimal_odds)
     
-    for row in all_rows:
-        # Must be same event, opposite selection, different book
-        if (row.event == bonus_row.event and 
-            row.selection == bonus_row.opposite and 
-            row.book != bonus_row.book):
-            
-            hedge_stake, profit, efficiency = calculate_hedge(
-                stake, bonus_row.odds, row.odds
-            )
-            
-            opportunities.append(HedgeOpportunity(
-                event=bonus_row.event,
-                selection=bonus_row.selection,
-                opposite=bonus_row.opposite,
-                bonus_book=bonus_row.book,
-                bonus_odds=bonus_row.odds,
-                hedge_book=row.book,
-                hedge_odds=row.odds,
-                hedge_stake=hedge_stake,
-                profit=profit,
-                efficiency=efficiency
-            ))
+    for row, hedge_odds, hedge_decimal in candidates:
+        hedge_stake, profit = hedge_bonus_winnings(winnings, hedge_decimal)
+        efficiency = profit / stake
+        if efficiency < min_efficiency:
+            continue
+        
+        opportunities.append(HedgeOpportunity(
+            event=bonus_row.event,
+            selection=bonus_row.selection,
+            opposite=bonus_row.opposite,
+            bonus_book=bonus_row.book,
+            bonus_odds=bonus_row.odds,
+            hedge_book=row.book,
+            hedge_odds=hedge_odds,
+            hedge_stake=hedge_stake,
+            profit=profit,
+            efficiency=efficiency
+        ))
     
     return opportunities
 
 
+def find_best_hedge_for_bonus(
+    bonus_row: OddsRow,
+    candidates: HedgeCandidates,
+    stake: float,
+    min_efficiency: float,
+    best: Optional[HedgeOpportunity] = None
+) -> Optional[HedgeOpportunity]:
+    """
+    Find the best hedge for a given bonus bet, keeping the running best
+    
+    Args:
+        bonus_row: The bonus bet to hedge
+        candidates: Other books' prices on the opposite outcome, from iter_hedge_candidates()
+        stake: Bonus bet stake amount
+        min_efficiency: Minimum efficiency threshold (0.0 to 1.0)
+        best: Best opportunity found so far, if any
+        
+    Returns:
+        A new HedgeOpportunity if one beats `best`, otherwise `best`
+    """
+    # Fixed for every candidate, so work it out once
+    winnings = bonus_winnings(stake, bonus_row.decimal_odds)
+    
+    for row, hedge_odds, hedge_decimal in candidates:
+        hedge_stake, profit = hedge_bonus_winnings(winnings, hedge_decimal)
+        efficiency = profit / stake
+        
+        # Only allocate an opportunity when it can be the new best
+        if efficiency < min_efficiency:
+            continue
+        if best is not None and efficiency < best.efficiency:
+            continue
+        
+        candidate = HedgeOpportunity(
+            event=bonus_row.event,
+            selection=bonus_row.selection,
+            opposite=bonus_row.opposite,
+            bonus_book=bonus_row.book,
+            bonus_odds=bonus_row.odds,
+            hedge_book=row.book,
+            hedge_odds=hedge_odds,
+            hedge_stake=hedge_stake,
+            profit=profit,
+            efficiency=efficiency
+        )
+        if best is None or hedge_rank(candidate) < hedge_rank(best):
+            best = candidate
+    
+    return best
+
+
+if njit is not None:
+    @njit(cache=True)
+    def best_hedge_kernel(dA, dB, stake):
+        """
+        Compiled best-efficiency reduction over decimal odds arrays
+        
+        Fuses the math of find_best_hedge_in_batch() into one pass with no
+        temporary arrays.
+        
+        Returns:
+            Tuple of (best efficiency, indices of every pair reaching it)
+        """
+        ties = np.empty(dA.size, dtype=np.int64)
+        n_ties = 0
+        best_eff = -np.inf
+        for i in range(dA.size):
+            winnings = stake * (dA[i] - 1)
+            hedge = winnings / dB[i]
+            efficiency = min(winnings - hedge, hedge * (dB[i] - 1)) / stake
+            if efficiency > best_eff:
+                best_eff = efficiency
+                ties[0] = i
+                n_ties = 1
+            elif efficiency == best_eff:
+                ties[n_ties] = i
+                n_ties += 1
+        return best_eff, ties[:n_ties]
+else:
+    best_hedge_kernel = None
+
+
+# (bonus, hedge) pairs gathered before each vectorized pass
+HEDGE_BATCH_SIZE = 2048
+
+
+def find_best_hedge_in_batch(
+    pairs: List[Tuple[OddsRow, OddsRow, float, float]],
+    stake: float,
+    min_efficiency: float,
+    best: Optional[HedgeOpportunity] = None
+) -> Optional[HedgeOpportunity]:
+    """
+    Run the hedge math over a batch of pairs at once, keeping the running best
+    
+    Args:
+        pairs: (bonus_row, hedge_row, hedge American price, hedge decimal price)
+        stake: Bonus bet stake amount
+        min_efficiency: Minimum efficiency threshold (0.0 to 1.0)
+        best: Best opportunity found so far, if any
+        
+    Returns:
+        A new HedgeOpportunity if one beats `best`, otherwise `best`
+    """
+    dA = np.fromiter((bonus_row.decimal_odds for bonus_row, _, _, _ in pairs), dtype=np.float64, count=len(pairs))
+    dB = np.fromiter((decimal for _, _, _, decimal in pairs), dtype=np.float64, count=len(pairs))
+    
+    if best_hedge_kernel is not None:
+        efficiency, ties = best_hedge_kernel(dA, dB, float(stake))
+    else:
+        # Same operations as bonus_winnings() and hedge_bonus_winnings(), elementwise
+        winnings = stake * (dA - 1)
+        hedge = winnings / dB
+        efficiencies = np.minimum(winnings - hedge, hedge * (dB - 1)) / stake
+        efficiency = efficiencies.max()
+        ties = np.flatnonzero(efficiencies == efficiency)
+    
+    if efficiency < min_efficiency:
+        return best
+    if best is not None and efficiency < best.efficiency:
+        return best
+    
+    # Only the pairs tied for the batch's best become opportunities;
+    # the scalar math gives the same floats as the arrays
+    for i in ties:
+        bonus_row, row, price, decimal = pairs[i]
+        best = find_best_hedge_for_bonus(bonus_row, [(row, price, decimal)], stake, min_efficiency, best)
+    return best
+
+
+def find_best_hedge_vectorized(
+    matches: Iterable[Tuple[OddsRow, HedgeCandidates]],
+    stake: float,
+    min_efficiency: float,
+    batch_size: int = HEDGE_BATCH_SIZE
+) -> Optional[HedgeOpportunity]:
+    """
+    Find the best hedge across all bonus bets with NumPy
+    
+    Pairs are buffered as matches arrive and searched batch_size at a time,
+    so memory stays bounded while odds stream in and only each batch's
+    winner can become a HedgeOpportunity.
+    
+    Args:
+        matches: Bonus bets and their candidates, from iter_hedge_candidates()
+        stake: Bonus bet stake amount
+        min_efficiency: Minimum efficiency threshold (0.0 to 1.0)
+        batch_size: Number of pairs per vectorized pass
+        
+    Returns:
+        Best HedgeOpportunity meeting criteria, or None
+    """
+    best = None
+    pairs = []
+    
+    for bonus_row, candidates in matches:
+        for row, price, decimal in candidates:
+            pairs.append((bonus_row, row, price, decimal))
+        if len(pairs) >= batch_size:
+            best = find_best_hedge_in_batch(pairs, stake, min_efficiency, best)
+            pairs = []
+    
+    if pairs:
+        best = find_best_hedge_in_batch(pairs, stake, min_efficiency, best)
+    
+    return best
+
+
 def find_all_opportunities(
-    rows: List[OddsRow],
+    rows: Iterable[OddsRow],
     bonus_book: str,
     stake: float,
     min_efficiency: float
@@ -526,7 +1015,7 @@ def find_all_opportunities(
     Find all hedge opportunities that meet minimum efficiency
     
     Args:
-        rows: All available odds
+        rows: All available odds, as a list or a stream from iter_all_odds()
         bonus_book: The book offering the bonus
         stake: Bonus bet stake amount
         min_efficiency: Minimum efficiency threshold (0.0 to 1.0)
@@ -535,38 +1024,60 @@ def find_all_opportunities(
         List of HedgeOpportunity objects meeting criteria
     """
     logger.debug(f"\n[SEARCH] Looking for hedges with bonus_book='{bonus_book}'")
+    all_opportunities = []
     
-    bonus_rows = [r for r in rows if r.book == bonus_book]
-    logger.debug(f"[SEARCH] Found {len(bonus_rows)} bonus opportunities")
+    for bonus_row, candidates in iter_hedge_candidates(rows, bonus_book):
+        opportunities = find_hedge_for_bonus(bonus_row, candidates, stake, min_efficiency)
+        all_opportunities.extend(opportunities)
     
-    if len(bonus_rows) == 0:
-        logger.debug(f"[SEARCH] WARNING - No odds found for bonus book '{bonus_book}'")
-        logger.debug(f"[SEARCH] Available books in data: {set(r.book for r in rows)}")
+    logger.debug(f"[SEARCH] {len(all_opportunities)} opportunities meet minimum efficiency of {min_efficiency*100:.2f}%")
     
-    all_opportunities = []
+    return all_opportunities
+
+
+def find_best_opportunity(
+    rows: Iterable[OddsRow],
+    bonus_book: str,
+    stake: float,
+    min_efficiency: float
+) -> Optional[HedgeOpportunity]:
+    """
+    Find the most efficient hedge opportunity without building the full list
     
-    for bonus_row in bonus_rows:
-        opportunities = find_hedge_for_bonus(bonus_row, rows, stake)
-        all_opportunities.extend(opportunities)
+    Args:
+        rows: All available odds, as a list or a stream from iter_all_odds()
+        bonus_book: The book offering the bonus
+        stake: Bonus bet stake amount
+        min_efficiency: Minimum efficiency threshold (0.0 to 1.0)
+        
+    Returns:
+        Best HedgeOpportunity meeting criteria, or None
+    """
+    logger.debug(f"\n[SEARCH] Looking for hedges with bonus_book='{bonus_book}'")
+    matches = iter_hedge_candidates(rows, bonus_book)
     
-    # Filter by minimum efficiency
-    filtered = [opp for opp in all_opportunities if opp.efficiency >= min_efficiency]
+    if np is not None:
+        best = find_best_hedge_vectorized(matches, stake, min_efficiency)
+    else:
+        best = None
+        for bonus_row, candidates in matches:
+            best = find_best_hedge_for_bonus(bonus_row, candidates, stake, min_efficiency, best)
     
-    logger.debug(f"[SEARCH] Found {len(all_opportunities)} total opportunities")
-    logger.debug(f"[SEARCH] {len(filtered)} meet minimum efficiency of {min_efficiency*100:.2f}%")
+    if best is None:
+        logger.debug(f"[SEARCH] No opportunity meets minimum efficiency of {min_efficiency*100:.2f}%")
     
-    return filtered
+    return best
 
 
 def select_best_opportunity(opportunities: List[HedgeOpportunity]) -> Optional[HedgeOpportunity]:
     """Select the opportunity with highest efficiency"""
     if not opportunities:
         return None
-    return max(opportunities, key=lambda x: x.efficiency)
+    return min(opportunities, key=hedge_rank)
 
 
 def find_qualifying_opportunities(
-    rows: List[OddsRow],
+    rows: Iterable[OddsRow],
     qual_book: str,
     stake: float,
     max_loss_pct: float
@@ -575,41 +1086,31 @@ def find_qualifying_opportunities(
     Find qualifying bet hedge opportunities within the max loss threshold.
 
     Args:
-        rows: All available odds
+        rows: All available odds, as a list or a stream from iter_all_odds()
         qual_book: Book where the qualifying bet must be placed
         stake: Qualifying bet amount
         max_loss_pct: Maximum loss as fraction of stake (e.g. 0.1 = 10% loss)
     """
     logger.debug(f"\n[QUAL] Looking for qualifying hedges with qual_book='{qual_book}'")
 
-    qual_rows = [r for r in rows if r.book == qual_book]
-    logger.debug(f"[QUAL] Found {len(qual_rows)} qualifying rows")
-
-    if not qual_rows:
-        logger.debug(f"[QUAL] WARNING - No odds found for '{qual_book}'")
-        logger.debug(f"[QUAL] Available books: {set(r.book for r in rows)}")
-
     all_opportunities = []
-    for qual_row in qual_rows:
-        for row in rows:
-            if (row.event == qual_row.event and
-                    row.selection == qual_row.opposite and
-                    row.book != qual_row.book):
-                hedge_stake, loss, loss_pct = calculate_qualifying_hedge(
-                    stake, qual_row.odds, row.odds
-                )
-                all_opportunities.append(QualifyingHedgeOpportunity(
-                    event=qual_row.event,
-                    selection=qual_row.selection,
-                    opposite=qual_row.opposite,
-                    qual_book=qual_row.book,
-                    qual_odds=qual_row.odds,
-                    hedge_book=row.book,
-                    hedge_odds=row.odds,
-                    hedge_stake=hedge_stake,
-                    loss=loss,
-                    loss_pct=loss_pct,
-                ))
+    for qual_row, candidates in iter_hedge_candidates(rows, qual_book):
+        for row, hedge_odds, _ in candidates:
+            hedge_stake, loss, loss_pct = calculate_qualifying_hedge(
+                stake, qual_row.odds, hedge_odds
+            )
+            all_opportunities.append(QualifyingHedgeOpportunity(
+                event=qual_row.event,
+                selection=qual_row.selection,
+                opposite=qual_row.opposite,
+                qual_book=qual_row.book,
+                qual_odds=qual_row.odds,
+                hedge_book=row.book,
+                hedge_odds=hedge_odds,
+                hedge_stake=hedge_stake,
+                loss=loss,
+                loss_pct=loss_pct,
+            ))
 
     filtered = [opp for opp in all_opportunities if opp.loss_pct <= max_loss_pct]
     logger.debug(f"[QUAL] {len(all_opportunities)} total, {len(filtered)} within {max_loss_pct*100:.2f}% max loss")
@@ -622,29 +1123,50 @@ def select_best_qualifying_opportunity(
     """Select the qualifying opportunity with the lowest loss (or highest profit if true arb)"""
     if not opportunities:
         return None
-    return min(opportunities, key=lambda x: x.loss_pct)
+    return min(opportunities, key=qualifying_hedge_rank)
 
 
 # -----------------------
 # OUTPUT
 # -----------------------
 
+# Opportunity listings longer than this are skipped unless --dump-all is given
+MAX_LOGGED_OPPORTUNITIES = 500
+
+
+def opportunity_lines(opp: HedgeOpportunity, stake: float) -> List[str]:
+    """Log lines describing a single hedge opportunity"""
+    return [
+        f"\n{opp.event}",
+        f"  Bonus: {opp.bonus_book} | {opp.selection} @ {opp.bonus_odds:+} (stake: ${stake:.2f})",
+        f"  Hedge: {opp.hedge_book} | {opp.opposite} @ {opp.hedge_odds:+} (stake: ${opp.hedge_stake:.2f})",
+        f"  → Profit: ${opp.profit:.2f} | Efficiency: {opp.efficiency*100:.2f}%",
+    ]
+
+
 def log_opportunity(opp: HedgeOpportunity, stake: float):
     """Log a single hedge opportunity to log file"""
-    logger.info(f"\n{opp.event}")
-    logger.info(f"  Bonus: {opp.bonus_book} | {opp.selection} @ {opp.bonus_odds:+} (stake: ${stake:.2f})")
-    logger.info(f"  Hedge: {opp.hedge_book} | {opp.opposite} @ {opp.hedge_odds:+} (stake: ${opp.hedge_stake:.2f})")
-    logger.info(f"  → Profit: ${opp.profit:.2f} | Efficiency: {opp.efficiency*100:.2f}%")
+    logger.info_lines(opportunity_lines(opp, stake))
 
 
-def log_all_opportunities(opportunities: List[HedgeOpportunity], stake: float):
-    """Log all tested opportunities"""
-    logger.info("\n" + "="*80)
-    logger.info(f"TESTING {len(opportunities)} BONUS HEDGE OPPORTUNITIES")
-    logger.info("="*80)
+def log_all_opportunities(opportunities: List[HedgeOpportunity], stake: float, dump_all: bool = False):
+    """
+    Log all tested opportunities
     
-    for opp in opportunities:
-        log_opportunity(opp, stake)
+    The listing is formatted up front and written in one go. Past
+    MAX_LOGGED_OPPORTUNITIES it is skipped unless dump_all is set.
+    """
+    lines = [
+        "\n" + "="*80,
+        f"TESTING {len(opportunities)} BONUS HEDGE OPPORTUNITIES",
+        "="*80,
+    ]
+    if len(opportunities) > MAX_LOGGED_OPPORTUNITIES and not dump_all:
+        lines.append(f"Listing skipped (more than {MAX_LOGGED_OPPORTUNITIES}, use --dump-all to log them)")
+    else:
+        for opp in opportunities:
+            lines.extend(opportunity_lines(opp, stake))
+    logger.info_lines(lines)
 
 
 def log_best_opportunity(opp: HedgeOpportunity):
@@ -681,22 +1203,39 @@ def log_no_opportunities():
     logger.info("[RESULT] Check minimum efficiency threshold or available odds")
 
 
+def qualifying_opportunity_lines(opp: QualifyingHedgeOpportunity, stake: float) -> List[str]:
+    """Log lines describing a single qualifying hedge opportunity"""
+    label = "Profit" if opp.loss < 0 else "Loss"
+    return [
+        f"\n{opp.event}",
+        f"  Qualifying: {opp.qual_book} | {opp.selection} @ {opp.qual_odds:+} (stake: ${stake:.2f})",
+        f"  Hedge:      {opp.hedge_book} | {opp.opposite} @ {opp.hedge_odds:+} (stake: ${opp.hedge_stake:.2f})",
+        f"  → {label}: ${abs(opp.loss):.2f} | Loss: {opp.loss_pct*100:.2f}%",
+    ]
+
+
 def log_qualifying_opportunity(opp: QualifyingHedgeOpportunity, stake: float):
     """Log a single qualifying hedge opportunity to log file"""
-    label = "Profit" if opp.loss < 0 else "Loss"
-    logger.info(f"\n{opp.event}")
-    logger.info(f"  Qualifying: {opp.qual_book} | {opp.selection} @ {opp.qual_odds:+} (stake: ${stake:.2f})")
-    logger.info(f"  Hedge:      {opp.hedge_book} | {opp.opposite} @ {opp.hedge_odds:+} (stake: ${opp.hedge_stake:.2f})")
-    logger.info(f"  → {label}: ${abs(opp.loss):.2f} | Loss: {opp.loss_pct*100:.2f}%")
+    logger.info_lines(qualifying_opportunity_lines(opp, stake))
 
 
-def log_all_qualifying_opportunities(opportunities: List[QualifyingHedgeOpportunity], stake: float):
-    """Log all tested qualifying opportunities"""
-    logger.info("\n" + "="*80)
-    logger.info(f"TESTING {len(opportunities)} QUALIFYING HEDGE OPPORTUNITIES")
-    logger.info("="*80)
-    for opp in opportunities:
-        log_qualifying_opportunity(opp, stake)
+def log_all_qualifying_opportunities(
+    opportunities: List[QualifyingHedgeOpportunity],
+    stake: float,
+    dump_all: bool = False
+):
+    """Log all tested qualifying opportunities (see log_all_opportunities)"""
+    lines = [
+        "\n" + "="*80,
+        f"TESTING {len(opportunities)} QUALIFYING HEDGE OPPORTUNITIES",
+        "="*80,
+    ]
+    if len(opportunities) > MAX_LOGGED_OPPORTUNITIES and not dump_all:
+        lines.append(f"Listing skipped (more than {MAX_LOGGED_OPPORTUNITIES}, use --dump-all to log them)")
+    else:
+        for opp in opportunities:
+            lines.extend(qualifying_opportunity_lines(opp, stake))
+    logger.info_lines(lines)
 
 
 def log_best_qualifying_opportunity(opp: QualifyingHedgeOpportunity, stake: float):
@@ -769,8 +1308,18 @@ def parse_arguments():
     parser.add_argument("--sports", default="nba,ncaab", help="Comma-separated list of sports")
     parser.add_argument("--stake", type=float, default=250, help="Bet stake amount in dollars")
     parser.add_argument("--min-eff", type=float, default=0.0, help="Min efficiency threshold (bonus mode, 0.0-1.0)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log every opportunity meeting the threshold to debug.log (bonus mode)")
+    parser.add_argument("--dump-all", action="store_true",
+                        help=f"Log opportunity listings even when longer than {MAX_LOGGED_OPPORTUNITIES} entries")
     parser.add_argument("--max-loss", type=float, default=1.0,
                         help="Max acceptable loss as fraction of stake (qualifying mode, e.g. 0.05 = 5%%)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Leave debug diagnostics out of debug.log (results are still logged)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always fetch fresh odds instead of reusing cached API responses")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL,
+                        help="Seconds to reuse cached API responses (requires requests-cache)")
     parser.add_argument("--calc", action="store_true",
                         help="Manual calculator: skip API, compute hedge from --odds-a and --odds-b")
     parser.add_argument("--odds-a", type=float, default=None,
@@ -782,6 +1331,7 @@ def parse_arguments():
 
 def main():
     args = parse_arguments()
+    logger.enabled_debug = not args.quiet
 
     # Manual calculator: no API needed
     if args.calc:
@@ -809,7 +1359,14 @@ def main():
     else:
         logger.debug(f"Max loss: {args.max_loss*100}%")
 
-    # Parse configuration
+    cache_ttl = None if args.no_cache else args.cache_ttl
+    configure_session(cache_ttl)
+    if requests_cache is None:
+        logger.debug("Response cache: unavailable (pip install requests-cache)")
+    else:
+        logger.debug(f"Response cache: {'disabled' if cache_ttl is None else f'{cache_ttl}s'}")
+
+    # Parse configuration once; everything downstream takes the normalized keys
     try:
         hedge_books = parse_books(args.books)
         bonus_book = BOOK_ALIASES[args.bonus_book.lower()]
@@ -817,42 +1374,59 @@ def main():
         logger.debug(f"\n[ERROR] Invalid book name: {e}")
         logger.debug(f"[ERROR] Valid book names: {list(BOOK_ALIASES.keys())}")
         raise
+    try:
+        sport_keys = parse_sports(args.sports)
+    except KeyError as e:
+        logger.debug(f"\n[ERROR] Invalid sport name: {e}")
+        logger.debug(f"[ERROR] Valid sport names: {list(SPORT_KEYS.keys())}")
+        raise
     
     all_books = hedge_books | {bonus_book}
     regions = get_regions_needed(all_books)
-    sports = args.sports.split(",")
     
     logger.debug(f"\n[CONFIG] Resolved bonus book: {bonus_book}")
     logger.debug(f"[CONFIG] Hedge books: {hedge_books}")
     logger.debug(f"[CONFIG] All books: {all_books}")
     logger.debug(f"[CONFIG] Regions to query: {regions}")
-    logger.debug(f"[CONFIG] Sports to query: {sports}")
+    logger.debug(f"[CONFIG] Sports to query: {sport_keys}")
     
-    # Collect odds data
+    # Odds stream from the API straight into the search, so hedges are
+    # matched while later responses are still arriving
+    book_counts = {}
+    events = set()
+    odds_rows = tally_odds(iter_all_odds(args.api_key, sport_keys, regions, all_books), book_counts, events)
+    
+    # Find opportunities and display results. Fetching and searching are
+    # interleaved, but fetch errors are logged and skipped per request in
+    # iter_all_odds(), so anything caught here comes from the search.
     try:
-        odds_rows = collect_all_odds(args.api_key, sports, regions, all_books)
+        if args.mode == "bonus":
+            if args.verbose:
+                opportunities = find_all_opportunities(odds_rows, bonus_book, args.stake, args.min_eff)
+            else:
+                best = find_best_opportunity(odds_rows, bonus_book, args.stake, args.min_eff)
+        else:
+            opportunities = find_qualifying_opportunities(odds_rows, bonus_book, args.stake, args.max_loss)
     except Exception as e:
-        logger.debug(f"\n[ERROR] Failed to collect odds: {str(e)}")
-        logger.debug(f"[ERROR] Check debug.log for detailed API diagnostics")
+        logger.debug(f"\n[ERROR] Hedge search failed: {type(e).__name__}: {str(e)}")
+        logger.debug(f"[ERROR] API errors are logged per request above and do not stop the search")
         raise
     
-    log_collection_summary(odds_rows)
+    log_collection_summary(book_counts, events)
     
-    # Find opportunities and display results
     if args.mode == "bonus":
-        opportunities = find_all_opportunities(odds_rows, bonus_book, args.stake, args.min_eff)
-        if not opportunities:
+        if args.verbose:
+            log_all_opportunities(opportunities, args.stake, args.dump_all)
+            best = select_best_opportunity(opportunities)
+        if best is None:
             log_no_opportunities()
             return
-        log_all_opportunities(opportunities, args.stake)
-        best = select_best_opportunity(opportunities)
         log_best_opportunity(best)
     else:
-        opportunities = find_qualifying_opportunities(odds_rows, bonus_book, args.stake, args.max_loss)
         if not opportunities:
             log_no_qualifying_opportunities()
             return
-        log_all_qualifying_opportunities(opportunities, args.stake)
+        log_all_qualifying_opportunities(opportunities, args.stake, args.dump_all)
         best = select_best_qualifying_opportunity(opportunities)
         log_best_qualifying_opportunity(best, args.stake)
 